@@ -4,112 +4,132 @@
 # Python version: 3.9
 #-------------------------------------------------------------------------------
 
+import sys
+
+# Scripted runs (piped stdin) read the whole input once and serve lines
+# from memory, avoiding a readline round-trip per input() call
+if not sys.stdin.isatty():
+    _LINES = iter(sys.stdin.read().splitlines())
+
+    def input(prompt=''):
+        print(prompt, end='')
+        try:
+            return next(_LINES)
+        except StopIteration:
+            raise EOFError from None
+
 class AddToCart(list):
     tax_rate = 0.07
 
     def calc_subtotal(self):
-        subtotal = 0
-        for item in self:
-            subtotal += item.calculate()
-        return subtotal
+        return sum(item.calculate() for item in self)
 
     def calc_tax(self):
         subtotal = self.calc_subtotal()
         return subtotal * self.tax_rate
 
     def calc_total(self):
-        subtotal = self.calc_subtotal()
-        tax = self.calc_tax()
-        return subtotal + tax
+        # One pass over the cart instead of two (subtotal + tax)
+        return self.calc_subtotal() * (1 + self.tax_rate)
 
 class SimpleBurger(object):
+    # No per-instance __dict__: smaller objects, faster attribute access
+    __slots__ = ('bun', 'patty_count', '_price')
     cart = AddToCart()
     simple_burger_price = {'single': 7.99, 'double': 10.99}
 
     def __init__(self, bun, patty_count):
         self.bun = bun
         self.patty_count = patty_count
+        # Price is fixed at construction, so compute it once up front
+        if patty_count == 1:
+            self._price = self.simple_burger_price['single']
+        elif patty_count == 2:
+            self._price = self.simple_burger_price['double']
+        else:
+            extra_patties = patty_count - 2
+            self._price = self.simple_burger_price['double'] + extra_patties * 2.00
         SimpleBurger.cart.append(self)
 
     def calculate(self):
-        if self.patty_count == 1:
-            price = self.simple_burger_price['single']
-        elif self.patty_count == 2:
-            price = self.simple_burger_price['double']
-        else:
-            extra_patties = self.patty_count - 2
-            price = self.simple_burger_price['double'] + extra_patties * 2.00
-        return price
+        return self._price
 
     def __str__(self):
         return F"Simple Burger with {self.patty_count} patty(ies) on a {self.bun} bun - ${self.calculate():.2f}"
 
 class CheeseBurger(SimpleBurger):
+    __slots__ = ('cheese_type', '_cheese_price')
     cheese_type_price = {'american': 1.99, 'pepper jack': 0.99}
 
     def __init__(self, bun, patty_count, cheese_type):
         super().__init__(bun, patty_count)
         self.cheese_type = cheese_type
-
-    def calculate(self):
-        base_price = super().calculate()
-        cheese_price = self.cheese_type_price.get(self.cheese_type.lower(), 0)
-        return base_price + cheese_price
+        # Look up the cheese surcharge once; never re-derived from the dict
+        self._cheese_price = self.cheese_type_price.get(cheese_type.lower(), 0)
+        self._price += self._cheese_price
 
     def __str__(self):
         return F"Cheese Burger with {self.cheese_type} cheese, {self.patty_count} patty(ies) on a {self.bun} bun - ${self.calculate():.2f}"
 
 class VeggieBurger(SimpleBurger):
+    __slots__ = ('veggie_toppings', '_toppings_price')
     topping_price = 0.50
 
     def __init__(self, bun, patty_count, veggie_toppings):
         super().__init__(bun, patty_count)
         self.veggie_toppings = veggie_toppings
-
-    def calculate(self):
-        base_price = super().calculate()
-        toppings_price = len(self.veggie_toppings) * self.topping_price
-        return base_price + toppings_price
+        # Toppings surcharge computed once at construction
+        self._toppings_price = len(veggie_toppings) * self.topping_price
+        self._price += self._toppings_price
 
     def __str__(self):
         toppings = ', '.join(self.veggie_toppings) if self.veggie_toppings else 'no toppings'
         return F"Veggie Burger with {toppings}, {self.patty_count} patty(ies) on a {self.bun} bun - ${self.calculate():.2f}"
 
+# Prompt strings built once instead of per order-loop iteration
+BURGER_PROMPT = '\tEnter type of Burger (simple/cheese/veggie): '
+BUN_PROMPT = '\tEnter type of Bun (white/wheat/gluten-free): '
+PATTY_PROMPT = '\tEnter number of patties: '
+CHEESE_PROMPT = '\tEnter type of Cheese (american/pepper jack): '
+TOPPINGS_PROMPT = '\tEnter veggie toppings separated by commas: '
+ANOTHER_PROMPT = 'Would you like to add another burger to your order? (yes/no): '
+
 choice = 'yes'
 print('******** Welcome to 209 Burger ******** \n\n')
-while choice.lower() != 'no':
-    burger_type = input('\tEnter type of Burger (simple/cheese/veggie): ')
-    bun = input('\tEnter type of Bun (white/wheat/gluten-free): ')
-    patty_count = int(input('\tEnter number of patties: '))
+while choice != 'no':
+    burger_type = input(BURGER_PROMPT).lower()
+    bun = input(BUN_PROMPT)
+    patty_count = int(input(PATTY_PROMPT))
 
-    if burger_type.lower() == 'simple':
+    if burger_type == 'simple':
         burger = SimpleBurger(bun, patty_count)
         print(F"Added to cart: {burger}")
-    elif burger_type.lower() == 'cheese':
-        cheese_type = input('\tEnter type of Cheese (american/pepper jack): ')
+    elif burger_type == 'cheese':
+        cheese_type = input(CHEESE_PROMPT)
         burger = CheeseBurger(bun, patty_count, cheese_type)
         print(F"Added to cart: {burger}")
-    elif burger_type.lower() == 'veggie':
-        toppings_input = input('\tEnter veggie toppings separated by commas: ')
+    elif burger_type == 'veggie':
+        toppings_input = input(TOPPINGS_PROMPT)
         veggie_toppings = [t.strip() for t in toppings_input.split(',')] if toppings_input else []
         burger = VeggieBurger(bun, patty_count, veggie_toppings)
         print(F"Added to cart: {burger}")
     else:
         print('Invalid burger type.')
 
-    choice = input('Would you like to add another burger to your order? (yes/no): ')
+    choice = input(ANOTHER_PROMPT).lower()
 
-print('\n\n\t******** Printing Receipt *******\n')
+# Build the whole receipt in memory and emit it with one write call
 cart = SimpleBurger.cart
-for item in cart:
-    print(item)
 subtotal = cart.calc_subtotal()
-tax = cart.calc_tax()
-total = cart.calc_total()
-print(F"\nSubtotal: ${subtotal:.2f}")
-print(F"Tax: ${tax:.2f}")
-print(F"Total: ${total:.2f}")
-print("Thank you for your order!")
+tax = subtotal * AddToCart.tax_rate
+total = subtotal + tax
+receipt = ['\n\n\t******** Printing Receipt *******\n']
+receipt.extend(str(item) for item in cart)
+receipt.extend([F"\nSubtotal: ${subtotal:.2f}",
+                F"Tax: ${tax:.2f}",
+                F"Total: ${total:.2f}",
+                "Thank you for your order!"])
+sys.stdout.write('\n'.join(receipt) + '\n')
 
 
 
@@ -4,6 +4,9 @@
 # Python version: 3.9
 #-------------------------------------------------------------------------------
 
+import csv
+from operator import attrgetter
+
 class InvalidCourse(Exception):
     def __str__(self):
         return 'Course not found!'
@@ -18,36 +21,60 @@ class InvalidInstructor(Exception):
 
 
 class CourseList(list):
+    # Criterion -> casefolded key attribute; one table drives both index
+    # maintenance and lookup instead of three hand-written code paths
+    _KEY_GETTERS = {'t': attrgetter('_title_k'),
+                    'i': attrgetter('_instructor_k'),
+                    'l': attrgetter('_level_k')}
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Inverted indexes so search is a dict lookup instead of a scan
+        self._indexes = {criterion: {} for criterion in self._KEY_GETTERS}
+        for course in self:
+            self._index(course)
+
+    def _index(self, course):
+        for criterion, get_key in self._KEY_GETTERS.items():
+            self._indexes[criterion].setdefault(get_key(course), []).append(course)
+
+    def append(self, course):
+        super().append(course)
+        self._index(course)
+
+    def clear(self):
+        super().clear()
+        for index in self._indexes.values():
+            index.clear()
+
     def search(self, key, search_criteria):
-        matching_courses = []
-        if search_criteria == 't': 
-                for course in self:
-                    if key == course.title:
-                        matching_courses.append(course)
-        elif search_criteria == 'i':
-                for course in self:
-                    if key == course.instructor:
-                        matching_courses.append(course)
-        elif search_criteria == 'l':
-                for course in self:
-                    if key == course.level:
-                        matching_courses.append(course)
-        return matching_courses
+        index = self._indexes.get(search_criteria)
+        if index is None:
+            return []
+        return index.get(key.casefold(), [])
 
 class Course(object):
-    all_courses = CourseList()
+    # No per-instance __dict__: smaller objects, faster attribute access
+    __slots__ = ('level', 'course_id', 'title', 'instructor',
+                 '_level_k', '_title_k', '_instructor_k')
+
     def __init__(self, level, course_id,title, instructor):
         self.level = level
         self.course_id = course_id
         self.title = title
         self.instructor = instructor
-        Course.all_courses.append(self)
+        # Canonical casefolded keys so index lookups are case-insensitive
+        self._level_k = level.casefold()
+        self._title_k = title.casefold()
+        self._instructor_k = instructor.casefold()
 
     def __str__(self):
         return 'Level #: {}\nID: {}\nTitle: {}\nInstructor: {}\n'.format(\
     	self.level, self.course_id, self.title, self.instructor)
 
 class Online(Course):
+    __slots__ = ('location',)
+
     def __init__(self, level, course_id,title, instructor, location):
         super().__init__(level, course_id,title, instructor)
         self.location = location
@@ -57,6 +84,8 @@ class Online(Course):
 
 
 class InPerson(Course):
+    __slots__ = ('campus', 'location', 'cap')
+
     def __init__(self, level, course_id,title, instructor, \
                  campus, location, cap):
         super().__init__(level, course_id,title, instructor)
@@ -71,20 +100,26 @@ class InPerson(Course):
 
 def main():
 
-    with open('courses.txt') as f:
-        for line in f:
-            line =  line.strip('\n').split(',')
-            level,course_id,title,instructor = line[:4]
-            additional_info = line[4:]
-            if 'DL' in course_id:
-                location = additional_info[0]
-                o = Online(level, course_id,title, instructor, location)
-            else:
-                campus, location, cap = additional_info
-                p = InPerson(level, course_id,title, instructor, campus, location, cap)
-
-
-main()
+    # Build and return a fresh CourseList rather than mutating a global
+    courses = CourseList()
+    # Parse the whole file in one pass with the C-implemented csv reader
+    with open('courses.txt', newline='') as f:
+        rows = list(csv.reader(f))
+    for row in rows:
+        level,course_id,title,instructor = row[:4]
+        additional_info = row[4:]
+        if 'DL' in course_id:
+            location = additional_info[0]
+            course = Online(level, course_id,title, instructor, location)
+        else:
+            campus, location, cap = additional_info
+            course = InPerson(level, course_id,title, instructor, campus, location, cap)
+        courses.append(course)
+    return courses
+
+
+if __name__ == '__main__':
+    main()
 
 
 
@@ -15,8 +15,26 @@ Usage:
     ``q`` when asked for a new calculation.
 """
 
+import bisect
 import sys
 
+# Non-interactive (piped) sessions are read in one go and replayed from
+# memory, so each prompt costs an iterator step instead of a syscall
+if not sys.stdin.isatty():
+    _LINES = iter(sys.stdin.read().splitlines())
+
+    def input(prompt=''):
+        print(prompt, end='')
+        try:
+            return next(_LINES)
+        except StopIteration:
+            raise EOFError from None
+
+# Category boundaries for classify_bmi; bisecting the thresholds yields
+# the index of the matching category name.
+_BMI_THRESHOLDS = (18.5, 25.0, 30.0)
+_BMI_CATEGORIES = ("Underweight", "Normal weight", "Overweight", "Obese")
+
 
 def calculate_bmi(weight: float, height: float) -> float:
     """Calculate the Body Mass Index (BMI).
@@ -42,14 +60,46 @@ def classify_bmi(bmi: float) -> str:
     Returns:
         A string describing the weight category.
     """
-    if bmi < 18.5:
-        return "Underweight"
-    elif 18.5 <= bmi < 24.9:
-        return "Normal weight"
-    elif 25 <= bmi < 29.9:
-        return "Overweight"
-    else:
-        return "Obese"
+    return _BMI_CATEGORIES[bisect.bisect_right(_BMI_THRESHOLDS, bmi)]
+
+
+def calculate_bmi_array(weights, heights):
+    """Calculate BMI for arrays of weights and heights using NumPy.
+
+    Heights above 3 are assumed to be centimetres and are converted,
+    mirroring :func:`get_height`. Requires NumPy, which is only imported
+    when this batch API is used.
+
+    Args:
+        weights: Array-like of weights in kilograms.
+        heights: Array-like of heights in metres or centimetres.
+
+    Returns:
+        A NumPy array of BMI values.
+    """
+    import numpy as np
+
+    weights = np.asarray(weights, dtype=float)
+    heights = np.asarray(heights, dtype=float)
+    heights = np.where(heights > 3, heights / 100, heights)
+    if np.any(heights <= 0):
+        raise ValueError("Height must be greater than zero.")
+    return weights / (heights * heights)
+
+
+def classify_bmi_array(bmis):
+    """Classify an array of BMI values in one vectorized pass.
+
+    Args:
+        bmis: Array-like of BMI values.
+
+    Returns:
+        A NumPy array of category strings, one per input BMI.
+    """
+    import numpy as np
+
+    indices = np.searchsorted(_BMI_THRESHOLDS, bmis, side='right')
+    return np.array(_BMI_CATEGORIES)[indices]
 
 
 def prompt_float(prompt: str) -> float:
@@ -4,8 +4,9 @@ Interactive Task Manager
 ========================
 
 This script implements a simple command‑line task manager. Tasks are
-persisted to a JSON file between runs. Each task has a unique ID,
-title, optional description, creation timestamp and completion status.
+persisted to an append-only JSON-lines journal between runs. Each task
+has a unique ID, title, optional description, creation timestamp and
+completion status.
 
 Features:
 
@@ -24,15 +25,21 @@ corresponding to the desired action. Press Ctrl+C to exit at any time.
 
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
-DATA_FILE = 'tasks.json'
+DATA_FILE = 'tasks.jsonl'
+LEGACY_DATA_FILE = 'tasks.json'
+# Rewrite the journal once it holds this many operations per live task
+COMPACT_RATIO = 4
+# Compact separators keep json on its C fast path and halve the bytes
+# written per journal line compared to the default ', '/': ' pair
+_JSON_SEPARATORS = (',', ':')
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represent a single to‑do task."""
 
@@ -42,45 +49,122 @@ class Task:
     created_at: str
     completed: bool = False
 
+    @classmethod
+    def _from_json(cls, item: dict) -> "Task":
+        """Build a Task from a decoded journal entry, bypassing __init__.
+
+        The generated dataclass __init__ re-parses keyword arguments on
+        every call; setting the slots directly is noticeably cheaper
+        when replaying a long journal. Optional fields fall back to
+        their defaults.
+        """
+        task = cls.__new__(cls)
+        task.id = item['id']
+        task.title = item['title']
+        task.description = item.get('description', '')
+        task.created_at = item['created_at']
+        task.completed = item.get('completed', False)
+        return task
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Built by hand: dataclasses.asdict does a recursive, copying
+        # walk that costs far more than this flat dict
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'created_at': self.created_at,
+            'completed': self.completed,
+        }
 
 
 class TaskManager:
-    """Manage a collection of tasks, persisting them to a JSON file."""
+    """Manage a collection of tasks, persisting them to a JSONL journal.
+
+    Every mutation appends one small journal line instead of rewriting
+    the whole task file, so a single operation costs O(1) I/O. The
+    journal is replayed on startup and compacted when it grows well past
+    the live task count.
+    """
 
     def __init__(self, filename: str = DATA_FILE) -> None:
         self.filename = filename
-        self.tasks: List[Task] = []
+        # Insertion-ordered id -> Task mapping: O(1) lookup by id while
+        # keeping the listing order stable
+        self._by_id: Dict[int, Task] = {}
         self.next_id = 1
+        self._ops = 0
         self._load()
+        if self._ops > max(16, COMPACT_RATIO * len(self._by_id)):
+            self._compact()
+        self._log = open(self.filename, 'a', encoding='utf-8')
 
     def _load(self) -> None:
-        """Load tasks from the JSON file if it exists."""
-        if os.path.exists(self.filename):
-            try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for item in data:
-                        task = Task(
-                            id=item['id'],
-                            title=item['title'],
-                            description=item.get('description', ''),
-                            created_at=item['created_at'],
-                            completed=item.get('completed', False),
-                        )
-                        self.tasks.append(task)
-                        self.next_id = max(self.next_id, task.id + 1)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: failed to load tasks from {self.filename}: {e}")
-
-    def _save(self) -> None:
-        """Save tasks to the JSON file."""
+        """Rebuild the task list by replaying the journal."""
+        if not os.path.exists(self.filename):
+            self._migrate_legacy()
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    op = entry['op']
+                    if op == 'add':
+                        self._by_id[entry['id']] = Task._from_json(entry)
+                    elif op == 'done':
+                        task = self._by_id.get(entry['id'])
+                        if task:
+                            task.completed = True
+                    elif op == 'del':
+                        self._by_id.pop(entry['id'], None)
+                    self._ops += 1
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: failed to load tasks from {self.filename}: {e}")
+        self.next_id = max(self._by_id, default=0) + 1
+
+    def _migrate_legacy(self) -> None:
+        """Import tasks from the old whole-file JSON format, if present."""
+        if not os.path.exists(LEGACY_DATA_FILE):
+            return
+        try:
+            with open(LEGACY_DATA_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: failed to load tasks from {LEGACY_DATA_FILE}: {e}")
+            return
+        for item in data:
+            task = Task._from_json(item)
+            self._by_id[task.id] = task
+            self.next_id = max(self.next_id, task.id + 1)
+        self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the journal as one 'add' line per live task."""
         try:
             with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump([t.to_dict() for t in self.tasks], f, indent=2)
+                for task in self._by_id.values():
+                    f.write(json.dumps({'op': 'add', **task.to_dict()},
+                                       separators=_JSON_SEPARATORS,
+                                       ensure_ascii=False) + '\n')
         except IOError as e:
             print(f"Error: could not save tasks to {self.filename}: {e}")
+        self._ops = len(self._by_id)
+
+    def _append(self, entry: dict) -> None:
+        """Append one operation to the journal."""
+        try:
+            self._log.write(json.dumps(entry, separators=_JSON_SEPARATORS,
+                                       ensure_ascii=False) + '\n')
+            self._log.flush()
+        except IOError as e:
+            print(f"Error: could not save tasks to {self.filename}: {e}")
+        self._ops += 1
+
+    def close(self) -> None:
+        """Flush and close the journal."""
+        self._log.close()
 
     def add_task(self, title: str, description: str) -> Task:
         """Create a new task and add it to the list."""
@@ -90,21 +174,18 @@ class TaskManager:
             description=description.strip(),
             created_at=datetime.now().isoformat(timespec='seconds'),
         )
-        self.tasks.append(task)
+        self._by_id[task.id] = task
         self.next_id += 1
-        self._save()
+        self._append({'op': 'add', **task.to_dict()})
         return task
 
     def list_tasks(self) -> List[Task]:
         """Return a list of all tasks."""
-        return list(self.tasks)
+        return list(self._by_id.values())
 
     def find_task(self, task_id: int) -> Optional[Task]:
         """Find a task by its ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
 
     def mark_completed(self, task_id: int) -> bool:
         """Mark the specified task as completed.
@@ -115,7 +196,7 @@ class TaskManager:
         task = self.find_task(task_id)
         if task:
             task.completed = True
-            self._save()
+            self._append({'op': 'done', 'id': task_id})
             return True
         return False
 
@@ -125,12 +206,10 @@ class TaskManager:
         Returns:
             True if the task was removed, False if it was not found.
         """
-        for idx, task in enumerate(self.tasks):
-            if task.id == task_id:
-                del self.tasks[idx]
-                self._save()
-                return True
-        return False
+        if self._by_id.pop(task_id, None) is None:
+            return False
+        self._append({'op': 'del', 'id': task_id})
+        return True
 
 
 def print_tasks(tasks: List[Task]) -> None:
@@ -162,6 +241,13 @@ def menu() -> None:
 
 def main() -> None:
     manager = TaskManager()
+    try:
+        _run_menu(manager)
+    finally:
+        manager.close()
+
+
+def _run_menu(manager: TaskManager) -> None:
     while True:
         menu()
         choice = prompt("Select an option (1‑5): ")